@@ -21,6 +21,7 @@ engine = create_engine(
     pool_size=config.DATABASE_ENGINE_POOL_SIZE,
     max_overflow=config.DATABASE_ENGINE_MAX_OVERFLOW,
     pool_pre_ping=config.DATABASE_ENGINE_POOL_PING,
+    pool_recycle=config.DATABASE_ENGINE_POOL_RECYCLE,
 )
 
 
@@ -193,6 +194,17 @@ def ensure_unique_default_per_project(target, value, oldvalue, initiator):
                 session.commit()
 
 
+def get_schema_for_session(db_session: Session) -> str:
+    """Returns the schema the session is bound to; 'default' for the core schema.
+
+    Useful as the tenant component of cache keys, since numeric ids are only
+    unique within an organization's schema.
+    """
+    execution_options = getattr(db_session.get_bind(), "_execution_options", None) or {}
+    schema_translate_map = execution_options.get("schema_translate_map") or {}
+    return schema_translate_map.get(None) or "default"
+
+
 def refetch_db_session(organization_slug: str) -> Session:
     schema_engine = engine.execution_options(
         schema_translate_map={
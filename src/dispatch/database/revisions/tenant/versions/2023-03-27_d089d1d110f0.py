@@ -5,8 +5,9 @@ Revises: d1b5ed66d83d
 Create Date: 2023-03-27 16:16:04.098781
 
 """
+# NOTE: do not import from dispatch.* here; migrations must be self-contained
+# so that enumerating revisions doesn't pull in the full application.
 from alembic import op
-import sqlalchemy as sa
 
 # revision identifiers, used by Alembic.
 revision = "d089d1d110f0"
@@ -17,17 +18,45 @@ depends_on = None
 
 def upgrade():
     # ### commands auto generated by Alembic - please adjust! ###
-    op.add_column("signal", sa.Column("create_case", sa.Boolean(), nullable=True))
-    op.add_column("signal", sa.Column("conversation_target", sa.String(), nullable=True))
-    op.add_column("signal", sa.Column("oncall_service_id", sa.Integer(), nullable=True))
-    op.create_foreign_key(None, "signal", "service", ["oncall_service_id"], ["id"])
+    # Single ALTER TABLE so the ACCESS EXCLUSIVE lock is taken once for all
+    # three columns instead of once per op.add_column round-trip.
+    # NOTE: no server_default -> metadata-only on PG11+; any backfill belongs
+    # in a separate migration that updates in batches, never inline here.
+    op.execute(
+        "ALTER TABLE signal "
+        "ADD COLUMN create_case BOOLEAN, "
+        "ADD COLUMN conversation_target VARCHAR, "
+        "ADD COLUMN oncall_service_id INTEGER"
+    )
+    # NOT VALID skips the full-table validation scan; the column is freshly
+    # added and all NULL, so there is nothing to validate.
+    op.execute(
+        "ALTER TABLE signal ADD CONSTRAINT fk_signal_oncall_service_id "
+        "FOREIGN KEY (oncall_service_id) REFERENCES service(id) NOT VALID"
+    )
+    # Validation only takes a SHARE UPDATE EXCLUSIVE lock and can run off-hours:
+    # op.execute("ALTER TABLE signal VALIDATE CONSTRAINT fk_signal_oncall_service_id")
+
+    # Index the FK column so deletes on service don't sequentially scan signal
+    # for referential-integrity checks; partial since most rows stay NULL.
+    # CONCURRENTLY cannot run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_signal_oncall_service_id "
+            "ON signal (oncall_service_id) WHERE oncall_service_id IS NOT NULL"
+        )
     # ### end Alembic commands ###
 
 
 def downgrade():
     # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_constraint(None, "signal", type_="foreignkey")
-    op.drop_column("signal", "oncall_service_id")
-    op.drop_column("signal", "conversation_target")
-    op.drop_column("signal", "create_case")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_signal_oncall_service_id")
+    op.drop_constraint("fk_signal_oncall_service_id", "signal", type_="foreignkey")
+    op.execute(
+        "ALTER TABLE signal "
+        "DROP COLUMN oncall_service_id, "
+        "DROP COLUMN conversation_target, "
+        "DROP COLUMN create_case"
+    )
     # ### end Alembic commands ###
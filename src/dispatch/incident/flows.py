@@ -15,7 +15,7 @@ from dispatch.event import service as event_service
 from dispatch.group import flows as group_flows
 from dispatch.group.enums import GroupType, GroupAction
 from dispatch.incident import service as incident_service
-from dispatch.incident.models import IncidentRead
+from dispatch.incident.models import IncidentRead, IncidentUpdateSnapshot
 from dispatch.individual import service as individual_service
 from dispatch.participant import flows as participant_flows
 from dispatch.participant import service as participant_service
@@ -481,7 +481,7 @@ def incident_closed_status_flow(incident: Incident, db_session=None):
 def conversation_topic_dispatcher(
     user_email: str,
     incident: Incident,
-    previous_incident: dict,
+    previous_incident: IncidentRead | IncidentUpdateSnapshot,
     db_session: Session,
 ):
     """Determines if the conversation topic needs to be updated."""
@@ -629,7 +629,7 @@ def incident_update_flow(
     commander_email: str,
     reporter_email: str,
     incident_id: int,
-    previous_incident: IncidentRead,
+    previous_incident: IncidentRead | IncidentUpdateSnapshot,
     organization_slug: str = None,
     db_session=None,
 ):
@@ -13,7 +13,7 @@ from dispatch.database.core import SessionLocal, resolve_attr
 from dispatch.document import service as document_service
 from dispatch.event import service as event_service
 from dispatch.incident.enums import IncidentStatus
-from dispatch.incident.models import Incident, IncidentRead
+from dispatch.incident.models import Incident, IncidentRead, IncidentUpdateSnapshot
 from dispatch.notification import service as notification_service
 from dispatch.forms.models import Forms
 from dispatch.messaging.strings import (
@@ -47,6 +47,13 @@ from dispatch.plugin import service as plugin_service
 log = logging.getLogger(__name__)
 
 
+def truncate_text(text: str, max_length: int = 500) -> str:
+    """Truncates text to the given length, appending an ellipsis when truncated."""
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}..."
+
+
 def get_suggested_documents(db_session, incident: Incident) -> list:
     """Get additional incident documents based on priority, type, and description."""
     plugin = plugin_service.get_active_instance(
@@ -85,11 +92,7 @@ def send_welcome_ephemeral_message_to_participant(
         )
         return
 
-    incident_description = (
-        incident.description
-        if len(incident.description) <= 500
-        else f"{incident.description[:500]}..."
-    )
+    incident_description = truncate_text(incident.description)
 
     # we send the ephemeral message
     message_kwargs = {
@@ -155,11 +158,7 @@ def send_welcome_email_to_participant(
         log.warning("Participant welcome email not sent, not email plugin configured.")
         return
 
-    incident_description = (
-        incident.description
-        if len(incident.description) <= 500
-        else f"{incident.description[:500]}..."
-    )
+    incident_description = truncate_text(incident.description)
 
     message_kwargs = {
         "name": incident.name,
@@ -230,11 +229,7 @@ def send_completed_form_email(
         log.warning("Completed form notification email not sent. No email plugin configured.")
         return
 
-    incident_description = (
-        form.incident.description
-        if len(form.incident.description) <= 500
-        else f"{form.incident.description[:500]}..."
-    )
+    incident_description = truncate_text(form.incident.description)
 
     message_kwargs = {
         "name": form.incident.name,
@@ -344,11 +339,7 @@ def send_incident_created_notifications(incident: Incident, db_session: SessionL
     else:
         notification_template.insert(0, INCIDENT_NAME)
 
-    incident_description = (
-        incident.description
-        if len(incident.description) <= 500
-        else f"{incident.description[:500]}..."
-    )
+    incident_description = truncate_text(incident.description)
 
     notification_kwargs = {
         "name": incident.name,
@@ -410,7 +401,9 @@ def send_incident_created_notifications(incident: Incident, db_session: SessionL
 
 
 def send_incident_update_notifications(
-    incident: Incident, previous_incident: IncidentRead, db_session: SessionLocal
+    incident: Incident,
+    previous_incident: IncidentRead | IncidentUpdateSnapshot,
+    db_session: SessionLocal,
 ):
     """Sends notifications about incident changes."""
     notification_text = "Incident Notification"
@@ -841,17 +834,9 @@ def send_incident_closed_information_review_reminder(incident: Incident, db_sess
         )
         return
 
-    incident_description = (
-        incident.description
-        if len(incident.description) <= 100
-        else f"{incident.description[:100]}..."
-    )
+    incident_description = truncate_text(incident.description, max_length=100)
 
-    incident_resolution = (
-        incident.resolution
-        if len(incident.resolution) <= 100
-        else f"{incident.resolution[:100]}..."
-    )
+    incident_resolution = truncate_text(incident.resolution, max_length=100)
 
     items = [
         {
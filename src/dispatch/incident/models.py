@@ -1,6 +1,6 @@
 from collections import Counter, defaultdict
 from datetime import datetime
-from typing import ForwardRef, List, Optional
+from typing import ForwardRef, List, NamedTuple, Optional
 
 from pydantic import validator, Field, HttpUrl
 
@@ -408,6 +408,34 @@ class IncidentRead(IncidentBase):
     workflow_instances: Optional[List[WorkflowInstanceRead]] = []
 
 
+class IncidentUpdateSnapshot(NamedTuple):
+    """Pre-update snapshot of the fields that incident_update_flow diffs.
+
+    Holds direct references for the nested objects so attribute access matches
+    IncidentRead without serializing the whole incident graph.
+    """
+
+    title: str
+    description: str
+    status: str
+    tags: tuple
+    incident_type: IncidentTypeBase
+    incident_severity: IncidentSeverityBase
+    incident_priority: IncidentPriorityBase
+
+    @classmethod
+    def from_incident(cls, incident: Incident) -> "IncidentUpdateSnapshot":
+        return cls(
+            title=incident.title,
+            description=incident.description,
+            status=incident.status,
+            tags=tuple(incident.tags),
+            incident_type=incident.incident_type,
+            incident_severity=incident.incident_severity,
+            incident_priority=incident.incident_priority,
+        )
+
+
 class IncidentExpandedPagination(Pagination):
     itemsPerPage: int
     page: int
@@ -1,35 +1,53 @@
-default_incident_priorities = [
-    {
-        "name": "Low",
-        "description": "This incident may require your team's attention during working hours until the incident is stable.",
-        "view_order": 1,
-        "tactical_report_reminder": 12,
-        "executive_report_reminder": 9999,
-        "color": "#8bc34a",
-        "page_commander": False,
-        "default": True,
-        "enabled": True,
-    },
-    {
-        "name": "Medium",
-        "description": "This incident may require your team's full attention during waking hours, including weekends, until the incident is stable.",
-        "view_order": 2,
-        "tactical_report_reminder": 6,
-        "executive_report_reminder": 12,
-        "color": "#ff9800",
-        "page_commander": False,
-        "default": False,
-        "enabled": True,
-    },
-    {
-        "name": "High",
-        "description": "This incident may require your team's full attention 24x7, and should be prioritized over all other work, until the incident is stable.",
-        "view_order": 3,
-        "tactical_report_reminder": 2,
-        "executive_report_reminder": 6,
-        "color": "#e53935",
-        "page_commander": False,
-        "default": False,
-        "enabled": True,
-    },
-]
+from dataclasses import dataclass
+from functools import cache
+
+
+@dataclass(slots=True, frozen=True)
+class IncidentPriorityTemplate:
+    """Immutable template for a default incident priority."""
+
+    name: str
+    description: str
+    view_order: int
+    tactical_report_reminder: int
+    executive_report_reminder: int
+    color: str
+    page_commander: bool
+    default: bool
+    enabled: bool
+
+
+# Column-major constants; rows are only materialized into templates on first use.
+_names = ("Low", "Medium", "High")
+_descriptions = (
+    "This incident may require your team's attention during working hours until the incident is stable.",
+    "This incident may require your team's full attention during waking hours, including weekends, until the incident is stable.",
+    "This incident may require your team's full attention 24x7, and should be prioritized over all other work, until the incident is stable.",
+)
+_view_orders = (1, 2, 3)
+_tactical_report_reminders = (12, 6, 2)
+_executive_report_reminders = (9999, 12, 6)
+_colors = ("#8bc34a", "#ff9800", "#e53935")
+_page_commanders = (False, False, False)
+_defaults = (True, False, False)
+_enableds = (True, True, True)
+
+
+@cache
+def default_incident_priorities() -> tuple[IncidentPriorityTemplate, ...]:
+    """Returns the default incident priority templates, built once and reused."""
+    return tuple(
+        IncidentPriorityTemplate(*row)
+        for row in zip(
+            _names,
+            _descriptions,
+            _view_orders,
+            _tactical_report_reminders,
+            _executive_report_reminders,
+            _colors,
+            _page_commanders,
+            _defaults,
+            _enableds,
+            strict=True,
+        )
+    )
@@ -35,6 +35,22 @@ from .service import (
 
 log = logging.getLogger(__name__)
 
+# compiled phrase matchers keyed by project id; rebuilding the matcher is the
+# dominant cost of the auto-tagger, so reuse it until the tag set changes
+_matcher_cache: dict[int, tuple[int, object]] = {}
+
+
+def _get_tag_matcher(project_id: int, tag_strings: list[str]):
+    """Returns a cached phrase matcher for the project, rebuilding it only when the tag set changes."""
+    signature = hash(frozenset(tag_strings))
+    cached = _matcher_cache.get(project_id)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    matcher = build_phrase_matcher("dispatch-tag", build_term_vocab(tag_strings))
+    _matcher_cache[project_id] = (signature, matcher)
+    return matcher
+
 
 @scheduler.add(every(1).hours, name="incident-auto-tagger")
 @timer
@@ -53,8 +69,7 @@ def incident_auto_tagger(db_session: SessionLocal, project: Project):
 
     tags = tag_service.get_all(db_session=db_session, project_id=project.id).all()
     tag_strings = [t.name.lower() for t in tags if t.discoverable]
-    phrases = build_term_vocab(tag_strings)
-    matcher = build_phrase_matcher("dispatch-tag", phrases)
+    matcher = _get_tag_matcher(project.id, tag_strings)
 
     incidents = get_all(db_session=db_session, project_id=project.id).all()
 
@@ -69,11 +84,12 @@ def incident_auto_tagger(db_session: SessionLocal, project: Project):
                 log.warn(e)
                 continue
 
-            extracted_tags = list(set(extract_terms_from_text(text, matcher)))
+            # dedup in one pass while preserving extraction order
+            extracted_tags = list(dict.fromkeys(extract_terms_from_text(text, matcher)))
 
             matched_tags = (
                 db_session.query(Tag)
-                .filter(func.upper(Tag.name).in_([func.upper(t) for t in extracted_tags]))
+                .filter(func.upper(Tag.name).in_([t.upper() for t in extracted_tags]))
                 .all()
             )
 
@@ -9,9 +9,13 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Optional
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import joinedload, selectinload
 
 from dispatch.decorators import timer
+from dispatch.enums import Visibility
 from dispatch.case import service as case_service
+from dispatch.conversation.models import Conversation
 from dispatch.cost_model import service as cost_model_service
 from dispatch.database.core import SessionLocal
 from dispatch.event import service as event_service
@@ -22,9 +26,11 @@ from dispatch.incident.type import service as incident_type_service
 from dispatch.incident_cost import service as incident_cost_service
 from dispatch.incident_role.service import resolve_role
 from dispatch.participant import flows as participant_flows
+from dispatch.participant.models import Participant
 from dispatch.participant_role.models import ParticipantRoleType
 from dispatch.plugin import service as plugin_service
 from dispatch.project import service as project_service
+from dispatch.project.models import Project
 from dispatch.tag import service as tag_service
 from dispatch.term import service as term_service
 
@@ -70,6 +76,58 @@ def get(*, db_session, incident_id: int) -> Optional[Incident]:
     return db_session.query(Incident).filter(Incident.id == incident_id).first()
 
 
+def get_with_participants(*, db_session, incident_id: int) -> Optional[Incident]:
+    """Returns an incident with its participants and their individuals eagerly loaded."""
+    return (
+        db_session.query(Incident)
+        .filter(Incident.id == incident_id)
+        .options(selectinload(Incident.participants).joinedload(Participant.individual))
+        .first()
+    )
+
+
+def get_for_update(*, db_session, incident_id: int) -> Optional[Incident]:
+    """Returns an incident with the relationships the update path reads eagerly loaded."""
+    return (
+        db_session.query(Incident)
+        .filter(Incident.id == incident_id)
+        .options(
+            joinedload(Incident.commander).joinedload(Participant.individual),
+            joinedload(Incident.reporter).joinedload(Participant.individual),
+            joinedload(Incident.project).joinedload(Project.organization),
+            joinedload(Incident.incident_type),
+            joinedload(Incident.incident_severity),
+            joinedload(Incident.incident_priority),
+        )
+        .first()
+    )
+
+
+def get_for_slack_handlers(*, db_session, incident_id: int) -> Optional[Incident]:
+    """Returns an incident with the relationships the Slack handlers traverse eagerly loaded."""
+    return (
+        db_session.query(Incident)
+        .filter(Incident.id == incident_id)
+        .options(
+            joinedload(Incident.project).joinedload(Project.organization),
+            joinedload(Incident.commander).joinedload(Participant.individual),
+        )
+        .first()
+    )
+
+
+def get_notification_summary(*, db_session, incident_id: int):
+    """Returns (name, status, visibility, channel_id) without loading the full incident."""
+    return (
+        db_session.query(
+            Incident.name, Incident.status, Incident.visibility, Conversation.channel_id
+        )
+        .outerjoin(Conversation, Conversation.incident_id == Incident.id)
+        .filter(Incident.id == incident_id)
+        .first()
+    )
+
+
 def get_by_name(*, db_session, project_id: int, name: str) -> Optional[Incident]:
     """Returns an incident based on the given name."""
     return (
@@ -149,6 +207,35 @@ def get_all_last_x_hours_by_status(
         )
 
 
+def get_all_open_or_recently_closed(
+    *, db_session, project_ids: List[int], closed_hours: int = 24
+) -> List[Incident]:
+    """Returns open-visibility active and stable incidents, plus incidents closed in the last x hours, for the given projects."""
+    now = datetime.utcnow()
+    return (
+        db_session.query(Incident)
+        .filter(Incident.project_id.in_(project_ids))
+        .filter(Incident.visibility == Visibility.open)
+        .filter(
+            or_(
+                Incident.status.in_([IncidentStatus.active, IncidentStatus.stable]),
+                and_(
+                    Incident.status == IncidentStatus.closed,
+                    Incident.closed_at >= now - timedelta(hours=closed_hours),
+                ),
+            )
+        )
+        .options(
+            joinedload(Incident.project).joinedload(Project.organization),
+            joinedload(Incident.commander).joinedload(Participant.individual),
+            joinedload(Incident.incident_type),
+            joinedload(Incident.incident_severity),
+            joinedload(Incident.incident_priority),
+        )
+        .all()
+    )
+
+
 def create(*, db_session, incident_in: IncidentCreate) -> Incident:
     """Creates a new incident."""
     project = project_service.get_by_name_or_default(
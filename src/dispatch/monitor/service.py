@@ -32,6 +32,14 @@ def get_by_weblink(*, db_session, weblink: str) -> Optional[Monitor]:
     return db_session.query(Monitor).filter(Monitor.weblink == weblink).one_or_none()
 
 
+def get_by_weblinks(*, db_session, weblinks: List[str]) -> set:
+    """Fetches the subset of the given weblinks that already have monitors."""
+    if not weblinks:
+        return set()
+    rows = db_session.query(Monitor.weblink).filter(Monitor.weblink.in_(weblinks)).all()
+    return {row.weblink for row in rows}
+
+
 def create_or_update(*, db_session, monitor_in: MonitorCreate) -> Monitor:
     """Creates or updates a monitor."""
     monitor = get_by_weblink(db_session=db_session, weblink=monitor_in.weblink)
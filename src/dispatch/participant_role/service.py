@@ -1,7 +1,9 @@
+from collections import defaultdict
 from datetime import datetime
 from typing import List, Optional
 
 from dispatch.participant import service as participant_service
+from dispatch.participant.models import Participant
 
 from .models import (
     ParticipantRole,
@@ -41,6 +43,24 @@ def get_all_active_roles(*, db_session, participant_id: int) -> List[Optional[Pa
     )
 
 
+def get_all_active_roles_by_incident_id(
+    *, db_session, incident_id: int
+) -> dict[int, List[ParticipantRole]]:
+    """Returns all active roles for the given incident id, mapped by participant id."""
+    roles = (
+        db_session.query(ParticipantRole)
+        .join(Participant, ParticipantRole.participant_id == Participant.id)
+        .filter(Participant.incident_id == incident_id)
+        .filter(ParticipantRole.renounced_at.is_(None))
+        .all()
+    )
+
+    roles_by_participant_id = defaultdict(list)
+    for role in roles:
+        roles_by_participant_id[role.participant_id].append(role)
+    return roles_by_participant_id
+
+
 def get_all(*, db_session):
     """Returns all participant roles."""
     return db_session.query(ParticipantRole)
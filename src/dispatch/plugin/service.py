@@ -1,7 +1,11 @@
 import logging
+from threading import Lock
+
+from cachetools import TTLCache
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 from typing import List, Optional
 
+from dispatch.database.core import get_schema_for_session
 from dispatch.exceptions import InvalidConfigurationError
 from dispatch.plugins.bases import OncallPlugin
 from dispatch.project import service as project_service
@@ -19,6 +23,15 @@ from .models import (
 
 log = logging.getLogger(__name__)
 
+# active plugin instance ids keyed by (schema, project_id, plugin_type); the
+# schema disambiguates tenants because project ids repeat across organization
+# schemas, and we cache ids rather than instances so each session still loads
+# its own ORM objects. clear() on instance CRUD drops all tenants' entries,
+# which only costs the next lookup a query.
+_active_instance_id_cache = TTLCache(maxsize=512, ttl=30)
+# TTLCache is not thread-safe and the hot callers run on thread pools
+_active_instance_id_lock = Lock()
+
 
 def get(*, db_session, plugin_id: int) -> Optional[Plugin]:
     """Returns a plugin based on the given plugin id."""
@@ -77,6 +90,31 @@ def get_active_instances(
     )
 
 
+def get_active_instance_cached(
+    *, db_session, plugin_type: str, project_id=None
+) -> Optional[PluginInstance]:
+    """Fetches the current active plugin for the given type, caching the instance id briefly.
+
+    Intended for hot event paths (e.g. Slack handlers) where the active plugin
+    rarely changes between events.
+    """
+    key = (get_schema_for_session(db_session), project_id, plugin_type)
+    with _active_instance_id_lock:
+        instance_id = _active_instance_id_cache.get(key)
+    if instance_id is not None:
+        instance = get_instance(db_session=db_session, plugin_instance_id=instance_id)
+        if instance and instance.enabled:
+            return instance
+
+    instance = get_active_instance(
+        db_session=db_session, plugin_type=plugin_type, project_id=project_id
+    )
+    if instance:
+        with _active_instance_id_lock:
+            _active_instance_id_cache[key] = instance.id
+    return instance
+
+
 def get_active_instance_by_slug(
     *, db_session, slug: str, project_id=None
 ) -> Optional[PluginInstance]:
@@ -120,6 +158,8 @@ def create_instance(*, db_session, plugin_instance_in: PluginInstanceCreate) ->
 
     db_session.add(plugin_instance)
     db_session.commit()
+    with _active_instance_id_lock:
+        _active_instance_id_cache.clear()
     return plugin_instance
 
 
@@ -166,6 +206,8 @@ def update_instance(
     plugin_instance.configuration = plugin_instance_in.configuration
 
     db_session.commit()
+    with _active_instance_id_lock:
+        _active_instance_id_cache.clear()
     return plugin_instance
 
 
@@ -173,6 +215,8 @@ def delete_instance(*, db_session, plugin_instance_id: int):
     """Deletes a plugin instance."""
     db_session.query(PluginInstance).filter(PluginInstance.id == plugin_instance_id).delete()
     db_session.commit()
+    with _active_instance_id_lock:
+        _active_instance_id_cache.clear()
 
 
 def get_plugin_event_by_id(*, db_session, plugin_event_id: int) -> Optional[PluginEvent]:
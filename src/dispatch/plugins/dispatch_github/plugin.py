@@ -23,6 +23,14 @@ class GithubConfiguration(BaseConfigurationModel):
     pass
 
 
+# compiled once at import; get_matchers is called for every chat message
+_MATCHERS = (
+    re.compile(
+        r"(?P<weblink>https:\/\/github.com\/(?P<organization>[a-zA-Z0-9-_]+)*\/(?P<repo>[a-zA-Z0-9-_]+)*\/(?P<type>pull|issues)*\/(?P<id>\w+)*)"
+    ),
+)
+
+
 def create_ua_string():
     client_name = __name__.split(".")[0]
     client_version = __version__  # Version is returned from _version.py
@@ -57,12 +65,9 @@ class GithubMonitorPlugin(MonitorPlugin):
     def __init__(self):
         self.configuration_schema = GithubConfiguration
 
-    def get_matchers(self, *args, **kwargs) -> list[Pattern]:
-        """Returns a list of regexes that this monitor plugin should look for in chat messages."""
-        matchers = [
-            r"(?P<weblink>https:\/\/github.com\/(?P<organization>[a-zA-Z0-9-_]+)*\/(?P<repo>[a-zA-Z0-9-_]+)*\/(?P<type>pull|issues)*\/(?P<id>\w+)*)"
-        ]
-        return [re.compile(r) for r in matchers]
+    def get_matchers(self, *args, **kwargs) -> tuple[Pattern, ...]:
+        """Returns the compiled regexes that this monitor plugin should look for in chat messages."""
+        return _MATCHERS
 
     @retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
     def get_match_status(self, weblink: str, last_modified: datetime = None, **kwargs) -> dict:
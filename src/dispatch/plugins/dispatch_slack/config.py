@@ -53,6 +53,11 @@ class SlackConversationConfiguration(SlackConfiguration):
         title="Ban Threads",
         description="If enabled, Dispatch will message users reminding them to not use threads in incident channels.",
     )
+    show_report_confirmation_modal: bool = Field(
+        False,
+        title="Show Report Confirmation Modal",
+        description="If enabled, Dispatch will update the report modal with a confirmation once the incident is created. When disabled, the incident channel invite serves as the confirmation, saving a Slack API call per report.",
+    )
     timeline_event_reaction: str = Field(
         "stopwatch",
         title="Timeline Event Reaction",
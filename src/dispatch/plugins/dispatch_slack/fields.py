@@ -1,5 +1,9 @@
 from datetime import timedelta
-from typing import List
+from functools import lru_cache
+from threading import Lock
+from typing import Callable, List
+
+from cachetools import TTLCache
 
 from blockkit import (
     PlainTextInput,
@@ -12,7 +16,7 @@ from blockkit import (
 )
 
 from dispatch.enums import DispatchEnum
-from dispatch.database.core import SessionLocal
+from dispatch.database.core import SessionLocal, get_schema_for_session
 from dispatch.project import service as project_service
 from dispatch.participant.models import Participant
 from dispatch.case.enums import CaseStatus, CaseResolutionReason
@@ -27,6 +31,28 @@ from dispatch.incident.priority import service as incident_priority_service
 from dispatch.incident.severity import service as incident_severity_service
 from dispatch.signal.models import Signal
 
+# incident type/severity/priority option lists per project; these back every
+# report/update modal and change rarely, so a short TTL saves three queries
+# per modal render. keys include the session's tenant schema because project
+# ids repeat across organization schemas.
+_incident_options_cache = TTLCache(maxsize=1024, ttl=60)
+# TTLCache is not thread-safe and Bolt handlers run on a thread pool
+_incident_options_lock = Lock()
+
+
+def _cached_options(
+    db_session: SessionLocal, kind: str, project_id: int, loader: Callable[[], List[dict]]
+) -> List[dict]:
+    """Returns the cached option list for the given kind/project, loading on miss."""
+    key = (get_schema_for_session(db_session), kind, project_id)
+    with _incident_options_lock:
+        options = _incident_options_cache.get(key)
+    if options is None:
+        options = loader()
+        with _incident_options_lock:
+            _incident_options_cache[key] = options
+    return options
+
 
 class DefaultBlockIds(DispatchEnum):
     date_picker_input = "date-picker-input"
@@ -305,9 +331,14 @@ def project_select(
     **kwargs,
 ):
     """Creates a project select."""
-    projects = [
-        {"text": p.name, "value": p.id} for p in project_service.get_all(db_session=db_session)
-    ]
+    projects = _cached_options(
+        db_session,
+        "project",
+        None,
+        lambda: [
+            {"text": p.name, "value": p.id} for p in project_service.get_all(db_session=db_session)
+        ],
+    )
     return static_select_block(
         placeholder="Select Project",
         options=projects,
@@ -319,6 +350,19 @@ def project_select(
     )
 
 
+@lru_cache(maxsize=128)
+def _title_input(label: str, placeholder: str, action_id: str, block_id: str, initial_value: str):
+    return Input(
+        element=PlainTextInput(
+            placeholder=placeholder,
+            initial_value=initial_value,
+            action_id=action_id,
+        ),
+        label=label,
+        block_id=block_id,
+    )
+
+
 def title_input(
     label: str = "Title",
     placeholder: str = "A brief explanatory title. You can change this later.",
@@ -327,16 +371,34 @@ def title_input(
     initial_value: str = None,
     **kwargs,
 ):
-    """Builds a title input."""
+    """Builds a title input; the common no-override call is memoized."""
+    if kwargs:
+        return Input(
+            element=PlainTextInput(
+                placeholder=placeholder,
+                initial_value=initial_value,
+                action_id=action_id,
+            ),
+            label=label,
+            block_id=block_id,
+            **kwargs,
+        )
+    return _title_input(label, placeholder, action_id, block_id, initial_value)
+
+
+@lru_cache(maxsize=128)
+def _description_input(
+    label: str, placeholder: str, action_id: str, block_id: str, initial_value: str
+):
     return Input(
         element=PlainTextInput(
             placeholder=placeholder,
             initial_value=initial_value,
+            multiline=True,
             action_id=action_id,
         ),
-        label=label,
         block_id=block_id,
-        **kwargs,
+        label=label,
     )
 
 
@@ -348,18 +410,20 @@ def description_input(
     initial_value: str = None,
     **kwargs,
 ):
-    """Builds a description input."""
-    return Input(
-        element=PlainTextInput(
-            placeholder=placeholder,
-            initial_value=initial_value,
-            multiline=True,
-            action_id=action_id,
-        ),
-        block_id=block_id,
-        label=label,
-        **kwargs,
-    )
+    """Builds a description input; the common no-override call is memoized."""
+    if kwargs:
+        return Input(
+            element=PlainTextInput(
+                placeholder=placeholder,
+                initial_value=initial_value,
+                multiline=True,
+                action_id=action_id,
+            ),
+            block_id=block_id,
+            label=label,
+            **kwargs,
+        )
+    return _description_input(label, placeholder, action_id, block_id, initial_value)
 
 
 def resolution_input(
@@ -414,12 +478,17 @@ def incident_priority_select(
     **kwargs,
 ):
     """Creates an incident priority select."""
-    priorities = [
-        {"text": p.name, "value": p.id}
-        for p in incident_priority_service.get_all_enabled(
-            db_session=db_session, project_id=project_id
-        )
-    ]
+    priorities = _cached_options(
+        db_session,
+        "priority",
+        project_id,
+        lambda: [
+            {"text": p.name, "value": p.id}
+            for p in incident_priority_service.get_all_enabled(
+                db_session=db_session, project_id=project_id
+            )
+        ],
+    )
     return static_select_block(
         placeholder="Select Priority",
         options=priorities,
@@ -461,12 +530,17 @@ def incident_severity_select(
     **kwargs,
 ):
     """Creates an incident severity select."""
-    severities = [
-        {"text": s.name, "value": s.id}
-        for s in incident_severity_service.get_all_enabled(
-            db_session=db_session, project_id=project_id
-        )
-    ]
+    severities = _cached_options(
+        db_session,
+        "severity",
+        project_id,
+        lambda: [
+            {"text": s.name, "value": s.id}
+            for s in incident_severity_service.get_all_enabled(
+                db_session=db_session, project_id=project_id
+            )
+        ],
+    )
     return static_select_block(
         placeholder="Select Severity",
         options=severities,
@@ -488,10 +562,17 @@ def incident_type_select(
     **kwargs,
 ):
     """Creates an incident type select."""
-    types = [
-        {"text": t.name, "value": t.id}
-        for t in incident_type_service.get_all_enabled(db_session=db_session, project_id=project_id)
-    ]
+    types = _cached_options(
+        db_session,
+        "type",
+        project_id,
+        lambda: [
+            {"text": t.name, "value": t.id}
+            for t in incident_type_service.get_all_enabled(
+                db_session=db_session, project_id=project_id
+            )
+        ],
+    )
     return static_select_block(
         placeholder="Select Type",
         options=types,
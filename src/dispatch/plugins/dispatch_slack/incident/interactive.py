@@ -1,10 +1,15 @@
 import logging
 import re
 import uuid
-from datetime import datetime, timedelta
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from threading import Lock
+from typing import Any, NamedTuple
 
-import pytz
+from zoneinfo import ZoneInfo
+
+from cachetools import TTLCache
 from blockkit import (
     Actions,
     Button,
@@ -14,7 +19,6 @@ from blockkit import (
     Image,
     Input,
     MarkdownText,
-    Message,
     Modal,
     PlainOption,
     PlainTextInput,
@@ -24,11 +28,13 @@ from blockkit import (
 from slack_bolt import Ack, BoltContext, BoltRequest, Respond
 from slack_sdk.errors import SlackApiError
 from slack_sdk.web.client import WebClient
-from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from dispatch.auth.models import DispatchUser
 from dispatch.config import DISPATCH_UI_URL
 from dispatch.cost_model import service as cost_model_service
+from dispatch.database.core import get_schema_for_session, refetch_db_session
 from dispatch.database.service import search_filter_sort_paginate
 from dispatch.enums import Visibility, EventType
 from dispatch.event import service as event_service
@@ -38,15 +44,24 @@ from dispatch.group.enums import GroupAction
 from dispatch.incident import flows as incident_flows
 from dispatch.incident import service as incident_service
 from dispatch.incident.enums import IncidentStatus
-from dispatch.incident.models import IncidentCreate, IncidentRead, IncidentUpdate
+from dispatch.incident.models import (
+    Incident,
+    IncidentCreate,
+    IncidentUpdate,
+    IncidentUpdateSnapshot,
+)
+from dispatch.incident.priority.models import IncidentPriorityBase, IncidentPriorityCreate
+from dispatch.incident.severity.models import IncidentSeverityBase, IncidentSeverityCreate
+from dispatch.incident.type.models import IncidentTypeBase, IncidentTypeCreate
 from dispatch.individual import service as individual_service
 from dispatch.individual.models import IndividualContactRead
 from dispatch.monitor import service as monitor_service
 from dispatch.monitor.models import MonitorCreate
 from dispatch.participant import service as participant_service
-from dispatch.participant.models import ParticipantUpdate
+from dispatch.participant.models import Participant, ParticipantUpdate
 from dispatch.participant_role import service as participant_role_service
 from dispatch.participant_role.enums import ParticipantRoleType
+from dispatch.participant_role.models import ParticipantRole
 from dispatch.plugin import service as plugin_service
 from dispatch.plugins.dispatch_slack import service as dispatch_slack_service
 from dispatch.plugins.dispatch_slack.bolt import app
@@ -119,6 +134,7 @@ from dispatch.plugins.dispatch_slack.service import (
     get_user_profile_by_email,
 )
 from dispatch.project import service as project_service
+from dispatch.project.models import Project, ProjectRead
 from dispatch.report import flows as report_flows
 from dispatch.report import service as report_service
 from dispatch.report.enums import ReportTypes
@@ -135,6 +151,109 @@ from dispatch.plugins.dispatch_slack.messaging import build_unexpected_error_mes
 log = logging.getLogger(__file__)
 
 
+@lru_cache(maxsize=512)
+def get_timezone(tz_name: str) -> ZoneInfo:
+    """Returns a cached timezone object; avoids re-resolving on every message."""
+    return ZoneInfo(tz_name)
+
+
+def _lazy_session(context: BoltContext) -> Session:
+    """Returns a fresh session for a lazy listener.
+
+    Bolt deep-copies the request before invoking a lazy function and silently
+    drops context entries that fail the copy - the middleware-provided
+    db_session among them - so lazy handlers must open their own session
+    instead of taking a db_session argument.
+    """
+    return refetch_db_session(context["subject"].organization_slug)
+
+
+# whether any monitor plugin is enabled, per project; refreshed every 5 minutes
+# so plugin configuration changes are picked up without a per-message query
+_monitor_plugins_configured = TTLCache(maxsize=1024, ttl=300)
+_monitor_plugins_lock = Lock()
+
+
+def has_monitor_plugins(db_session: Session, project_id: int) -> bool:
+    """Returns whether any monitor plugin is enabled for the given project."""
+    # project ids repeat across organization schemas, so key per tenant
+    key = (get_schema_for_session(db_session), project_id)
+    with _monitor_plugins_lock:
+        configured = _monitor_plugins_configured.get(key)
+    if configured is None:
+        configured = bool(
+            plugin_service.get_active_instances(
+                db_session=db_session, project_id=project_id, plugin_type="monitor"
+            )
+        )
+        with _monitor_plugins_lock:
+            _monitor_plugins_configured[key] = configured
+    return configured
+
+
+class IncidentSnapshot(NamedTuple):
+    """Shallow incident view used by the notification button handlers."""
+
+    name: str
+    status: str
+    visibility: str
+    channel_id: str | None
+
+
+# notification buttons see click bursts on popular incidents; serve the
+# gating fields from a short-lived snapshot instead of a SELECT per click
+_incident_snapshot_cache = TTLCache(maxsize=256, ttl=30)
+_incident_snapshot_lock = Lock()
+
+
+def get_incident_snapshot(db_session: Session, incident_id: int) -> IncidentSnapshot | None:
+    """Returns a cached shallow view of the incident, or None if it doesn't exist."""
+    # incident ids repeat across organization schemas, so key per tenant
+    key = (get_schema_for_session(db_session), incident_id)
+    with _incident_snapshot_lock:
+        snapshot = _incident_snapshot_cache.get(key)
+    if snapshot is not None:
+        return snapshot
+
+    row = incident_service.get_notification_summary(db_session=db_session, incident_id=incident_id)
+    if not row:
+        return None
+
+    snapshot = IncidentSnapshot(
+        name=row.name,
+        status=row.status,
+        visibility=row.visibility,
+        channel_id=row.channel_id,
+    )
+    with _incident_snapshot_lock:
+        _incident_snapshot_cache[key] = snapshot
+    return snapshot
+
+
+# channel membership per channel; during a notification blast the common case
+# is a clicker who already joined, so answer that without an invite round-trip
+_channel_members_cache = TTLCache(maxsize=512, ttl=15)
+_channel_members_lock = Lock()
+
+
+def is_channel_member(client: WebClient, channel_id: str, user_id: str) -> bool:
+    """Returns whether the user is a member of the channel, cached briefly."""
+    with _channel_members_lock:
+        members = _channel_members_cache.get(channel_id)
+    if members is None:
+        members = set()
+        cursor = None
+        while True:
+            response = client.conversations_members(channel=channel_id, cursor=cursor, limit=1000)
+            members.update(response["members"])
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+        with _channel_members_lock:
+            _channel_members_cache[channel_id] = members
+    return user_id in members
+
+
 def is_target_reaction(reaction: str) -> bool:
     """Returns True if given reaction matches the events' reaction."""
 
@@ -385,36 +504,17 @@ def handle_list_incidents_command(
         else:
             projects = project_service.get_all(db_session=db_session)
 
-    incidents = []
-    for project in projects:
-        # We fetch active incidents
-        incidents.extend(
-            incident_service.get_all_by_status(
-                db_session=db_session, project_id=project.id, status=IncidentStatus.active
-            )
-        )
-        # We fetch stable incidents
-        incidents.extend(
-            incident_service.get_all_by_status(
-                db_session=db_session,
-                project_id=project.id,
-                status=IncidentStatus.stable,
-            )
-        )
-        # We fetch closed incidents in the last 24 hours
-        incidents.extend(
-            incident_service.get_all_last_x_hours_by_status(
-                db_session=db_session,
-                project_id=project.id,
-                status=IncidentStatus.closed,
-                hours=24,
-            )
-        )
+    # we fetch active and stable incidents, plus incidents closed in the
+    # last 24 hours, for all projects in one query
+    incidents = incident_service.get_all_open_or_recently_closed(
+        db_session=db_session, project_ids=[project.id for project in projects], closed_hours=24
+    )
 
     blocks = []
 
     if incidents:
-        open_incidents = [i for i in incidents if i.visibility == Visibility.open]
+        # visibility is filtered in SQL; closed-visibility incidents never hydrate
+        open_incidents = incidents
         if len(open_incidents) > 50:
             blocks.extend(
                 [
@@ -427,26 +527,26 @@ def handle_list_incidents_command(
                 ]
             )
 
-        for idx, incident in enumerate(open_incidents[0:49], 1):
-            incident_weblink = f"{DISPATCH_UI_URL}/{incident.project.organization.name}/incidents/{incident.name}?project={incident.project.name}"
-            blocks.extend(
-                [
-                    Section(
-                        fields=[
-                            f"*<{incident_weblink}|{incident.name}>*\n {incident.title}",
-                            f"*Commander*\n<{incident.commander.individual.weblink}|{incident.commander.individual.name}>",
-                            f"*Project*\n{incident.project.name}",
-                            f"*Status*\n{incident.status}",
-                            f"*Type*\n {incident.incident_type.name}",
-                            f"*Severity*\n {incident.incident_severity.name}",
-                            f"*Priority*\n {incident.incident_priority.name}",
-                        ]
-                    )
-                ]
+        # build all blocks in one pass; no divider after the last incident
+        last_idx = len(open_incidents)
+        blocks.extend(
+            block
+            for idx, incident in enumerate(open_incidents[0:49], 1)
+            for block in (
+                Section(
+                    fields=[
+                        f"*<{DISPATCH_UI_URL}/{incident.project.organization.name}/incidents/{incident.name}?project={incident.project.name}|{incident.name}>*\n {incident.title}",
+                        f"*Commander*\n<{incident.commander.individual.weblink}|{incident.commander.individual.name}>",
+                        f"*Project*\n{incident.project.name}",
+                        f"*Status*\n{incident.status}",
+                        f"*Type*\n {incident.incident_type.name}",
+                        f"*Severity*\n {incident.incident_severity.name}",
+                        f"*Priority*\n {incident.incident_priority.name}",
+                    ]
+                ),
+                *(() if idx == last_idx else (Divider(),)),
             )
-            # Don't add a divider if we are at the last incident
-            if idx != len(open_incidents):
-                blocks.extend([Divider()])
+        )
 
     modal = Modal(
         title="Incident List",
@@ -482,30 +582,54 @@ def handle_list_participants_command(
             "Contact plugin is not enabled. Unable to list participants.",
         )
 
-    active_participants = [p for p in participants if p.active_roles]
-    for idx, participant in enumerate(active_participants, 1):
+    # one roles query for the whole incident instead of one per participant
+    roles_by_participant_id = participant_role_service.get_all_active_roles_by_incident_id(
+        db_session=db_session, incident_id=context["subject"].id
+    )
+    active_participants = [p for p in participants if roles_by_participant_id.get(p.id)]
+
+    # don't load avatars for large incidents; only active participants are
+    # rendered, so gate on them rather than the full historical list
+    load_avatars = len(active_participants) < 20
+
+    # contact lookups use the request session, which is not thread-safe, so
+    # they stay serial; only the session-free Slack avatar fetches fan out
+    emails = [p.individual.email for p in active_participants]
+    participant_infos = [
+        contact_plugin.instance.get(email, db_session=db_session) for email in emails
+    ]
+
+    avatar_urls = {}
+    if load_avatars:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            avatar_urls = dict(
+                zip(
+                    emails,
+                    executor.map(
+                        lambda email: dispatch_slack_service.get_user_avatar_url(client, email),
+                        emails,
+                    ),
+                    strict=True,
+                )
+            )
+
+    for idx, (participant, participant_info) in enumerate(
+        zip(active_participants, participant_infos, strict=True), 1
+    ):
         participant_email = participant.individual.email
-        participant_info = contact_plugin.instance.get(participant_email, db_session=db_session)
         participant_name = participant_info.get("fullname", participant.individual.email)
         participant_team = participant_info.get("team", "Unknown")
         participant_department = participant_info.get("department", "Unknown")
         participant_location = participant_info.get("location", "Unknown")
         participant_weblink = participant_info.get("weblink")
 
-        participant_active_roles = participant_role_service.get_all_active_roles(
-            db_session=db_session, participant_id=participant.id
-        )
-        participant_roles = []
-        for role in participant_active_roles:
-            participant_roles.append(role.role)
+        participant_roles = [role.role for role in roles_by_participant_id[participant.id]]
 
         accessory = None
-        # don't load avatars for large incidents
-        if len(participants) < 20:
-            participant_avatar_url = dispatch_slack_service.get_user_avatar_url(
-                client, participant_email
+        if load_avatars:
+            accessory = Image(
+                image_url=avatar_urls[participant_email], alt_text=participant_name
             )
-            accessory = Image(image_url=participant_avatar_url, alt_text=participant_name)
 
         blocks.extend(
             [
@@ -558,8 +682,8 @@ def filter_tasks_by_assignee_and_creator(
                 continue
 
         if by_assignee:
-            assignee_emails = [a.individual.email for a in t.assignees]
-            if by_assignee in assignee_emails:
+            # short-circuits without materializing the full assignee email list
+            if any(a.individual.email == by_assignee for a in t.assignees):
                 filtered_tasks.append(t)
 
     return filtered_tasks
@@ -576,9 +700,20 @@ def handle_list_tasks_command(
     """Handles the list tasks command."""
     ack()
 
-    tasks = task_service.get_all_by_incident_id(
-        db_session=db_session,
-        incident_id=context["subject"].id,
+    # materialize once with the relationships the modal renders, so block
+    # building doesn't lazy-load per task
+    tasks = (
+        task_service.get_all_by_incident_id(
+            db_session=db_session,
+            incident_id=context["subject"].id,
+        )
+        .options(
+            selectinload(Task.assignees).joinedload(Participant.individual),
+            joinedload(Task.creator).joinedload(Participant.individual),
+            joinedload(Task.project).joinedload(Project.organization),
+            joinedload(Task.incident),
+        )
+        .all()
     )
 
     caller_only = False
@@ -587,7 +722,8 @@ def handle_list_tasks_command(
         caller_only = True
 
     if caller_only:
-        email = (client.users_info(user=payload["user_id"]))["user"]["profile"]["email"]
+        # cached lookup; repeated invocations skip the Slack API round-trip
+        email = get_user_email(client=client, user_id=payload["user_id"])
         tasks = filter_tasks_by_assignee_and_creator(tasks, email, email)
 
     draw_task_modal(
@@ -609,12 +745,17 @@ def draw_task_modal(
     """Builds and draws the list tasks modal on first open and after each button click."""
     blocks = []
 
+    # partition tasks by status in one pass instead of rescanning per status
+    tasks_by_status = {status: [] for status in TaskStatus}
+    for task in tasks:
+        tasks_by_status[task.status].append(task)
+
     for status in TaskStatus:
         blocks.append(Section(text=f"*{status} Incident Tasks*"))
         button_text = "Resolve" if status == TaskStatus.open else "Re-open"
         action_type = "resolve" if status == TaskStatus.open else "reopen"
 
-        tasks_for_status = [task for task in tasks if task.status == status]
+        tasks_for_status = tasks_by_status[status]
 
         if not tasks_for_status:
             blocks.append(Section(text="No tasks."))
@@ -685,7 +826,7 @@ def handle_timeline_added_event(
 
     conversation_id = context["channel_id"]
     message_ts = payload["item"]["ts"]
-    message_ts_utc = datetime.utcfromtimestamp(float(message_ts))
+    message_ts_utc = datetime.fromtimestamp(float(message_ts), tz=timezone.utc)
 
     # we fetch the message information
     response = dispatch_slack_service.list_conversation_messages(
@@ -722,72 +863,75 @@ def handle_timeline_added_event(
         )
 
 
-@message_dispatcher.add(
-    subject="incident", exclude={"subtype": ["channel_join", "channel_leave"]}
-)  # we ignore channel join and leave messages
 def handle_participant_role_activity(
-    ack: Ack, db_session: Session, context: BoltContext, user: DispatchUser
+    db_session: Session, context: BoltContext, participant: Participant
 ) -> None:
     """
     Increments the participant role's activity counter and assesses the need of changing
     a participant's role based on its activity and changes it if needed.
     """
-    ack()
-    participant = participant_service.get_by_incident_id_and_email(
-        db_session=db_session, incident_id=context["subject"].id, email=user.email
-    )
+    if not participant:
+        return
 
-    if participant:
-        for participant_role in participant.active_roles:
-            participant_role.activity += 1
-
-            # re-assign role once threshold is reached
-            if participant_role.role == ParticipantRoleType.observer:
-                if participant_role.activity >= 10:  # ten messages sent to the incident channel
-                    # we change the participant's role to the participant one
-                    participant_role_service.renounce_role(
-                        db_session=db_session, participant_role=participant_role
-                    )
-                    participant_role_service.add_role(
-                        db_session=db_session,
-                        participant_id=participant.id,
-                        participant_role=ParticipantRoleType.participant,
-                    )
-
-                    # we log the event
-                    event_service.log_incident_event(
-                        db_session=db_session,
-                        source="Slack Plugin - Conversation Management",
-                        description=(
-                            f"{participant.individual.name}'s role changed from {participant_role.role} to "
-                            f"{ParticipantRoleType.participant} due to activity in the incident channel"
-                        ),
-                        incident_id=context["subject"].id,
-                        type=EventType.participant_updated,
-                    )
+    # we increment all active roles atomically in one statement; this avoids
+    # the per-message read-modify-write and is race-free on concurrent messages
+    role_table = ParticipantRole.__table__
+    updated_roles = db_session.execute(
+        role_table.update()
+        .where(
+            and_(
+                role_table.c.participant_id == participant.id,
+                role_table.c.renounced_at.is_(None),
+            )
+        )
+        .values(activity=role_table.c.activity + 1)
+        .returning(role_table.c.id, role_table.c.role, role_table.c.activity)
+    ).fetchall()
+
+    for role_id, role, activity in updated_roles:
+        # re-assign role once threshold is reached
+        if role == ParticipantRoleType.observer:
+            if activity >= 10:  # ten messages sent to the incident channel
+                # we change the participant's role to the participant one
+                participant_role = participant_role_service.get(
+                    db_session=db_session, participant_role_id=role_id
+                )
+                participant_role_service.renounce_role(
+                    db_session=db_session, participant_role=participant_role
+                )
+                participant_role_service.add_role(
+                    db_session=db_session,
+                    participant_id=participant.id,
+                    participant_role=ParticipantRoleType.participant,
+                )
 
-            db_session.commit()
+                # we log the event
+                event_service.log_incident_event(
+                    db_session=db_session,
+                    source="Slack Plugin - Conversation Management",
+                    description=(
+                        f"{participant.individual.name}'s role changed from {role} to "
+                        f"{ParticipantRoleType.participant} due to activity in the incident channel"
+                    ),
+                    incident_id=context["subject"].id,
+                    type=EventType.participant_updated,
+                )
+
+    db_session.commit()
 
 
-@message_dispatcher.add(
-    subject="incident", exclude={"subtype": ["channel_join", "group_join"]}
-)  # we ignore user channel and group join messages
 def handle_after_hours_message(
-    ack: Ack,
-    context: BoltContext,
     client: WebClient,
     db_session: Session,
     payload: dict,
-    user: DispatchUser,
+    incident: Incident,
+    participant: Participant,
 ) -> None:
     """Notifies the user that this incident is currently in after hours mode."""
-    ack()
+    if not participant:
+        return
 
-    incident = incident_service.get(db_session=db_session, incident_id=context["subject"].id)
     owner_email = incident.commander.individual.email
-    participant = participant_service.get_by_incident_id_and_email(
-        db_session=db_session, incident_id=context["subject"].id, email=user.email
-    )
     # get their timezone from slack
     try:
         owner_tz = (dispatch_slack_service.get_user_info_by_email(client, email=owner_email))["tz"]
@@ -804,7 +948,7 @@ def handle_after_hours_message(
 
     message = f"Responses may be delayed. The current incident priority is *{incident.incident_priority.name}* and your message was sent outside of the Incident Commander's working hours (Weekdays, 9am-5pm, {owner_tz} timezone)."
 
-    now = datetime.now(pytz.timezone(owner_tz))
+    now = datetime.now(get_timezone(owner_tz))
     is_business_hours = now.weekday() not in [5, 6] and 9 <= now.hour < 17
 
     if not is_business_hours:
@@ -819,13 +963,10 @@ def handle_after_hours_message(
             )
 
 
-@message_dispatcher.add(subject="incident")
 def handle_thread_creation(
-    ack: Ack, client: WebClient, payload: dict, context: BoltContext, request: BoltRequest
+    client: WebClient, payload: dict, context: BoltContext, request: BoltRequest
 ) -> None:
     """Sends the user an ephemeral message if they use threads."""
-    ack()
-
     if not context["config"].ban_threads:
         return
 
@@ -839,83 +980,161 @@ def handle_thread_creation(
         )
 
 
-@message_dispatcher.add(subject="incident")
 def handle_message_monitor(
-    ack: Ack,
     payload: dict,
     context: BoltContext,
     client: WebClient,
     db_session: Session,
+    incident: Incident,
 ) -> None:
     """Looks for strings that are available for monitoring (e.g. links)."""
-    ack()
+    text = payload["text"]
+    # most messages carry no links; a substring test beats running every matcher
+    if not text or ("://" not in text and "www." not in text):
+        return
 
-    incident = incident_service.get(db_session=db_session, incident_id=context["subject"].id)
+    # no monitor plugins is the common case; skip the plugin query entirely
+    if not has_monitor_plugins(db_session, context["subject"].project_id):
+        return
+
+    # hoist the relationship traversals so the match loop reads plain locals
     project_id = incident.project.id
+    organization_slug = incident.project.organization.slug
 
     plugins = plugin_service.get_active_instances(
         db_session=db_session, project_id=project_id, plugin_type="monitor"
     )
 
+    # first pass: collect candidate matches across all plugins/matchers
+    candidates = []
     for p in plugins:
         for matcher in p.instance.get_matchers():
-            for match in matcher.finditer(payload["text"]):
-                match_data = match.groupdict()
-                monitor = monitor_service.get_by_weblink(
-                    db_session=db_session, weblink=match_data["weblink"]
-                )
+            for match in matcher.finditer(text):
+                candidates.append((p, match.groupdict()))
 
-                # silence ignored matches
-                if monitor:
-                    continue
-
-                current_status = p.instance.get_match_status(match_data)
-                if current_status:
-                    status_text = ""
-                    for k, v in current_status.items():
-                        status_text += f"*{k.title()}*:\n{v.title()}\n"
-
-                    button_metadata = MonitorMetadata(
-                        type="incident",
-                        organization_slug=incident.project.organization.slug,
-                        id=incident.id,
-                        plugin_instance_id=p.id,
-                        project_id=incident.project.id,
-                        channel_id=context["channel_id"],
-                        weblink=match_data["weblink"],
-                    ).json()
-
-                    blocks = [
-                        Section(
-                            text=f"Hi! Dispatch is able to monitor the status of the following resource: \n {match_data['weblink']} \n\n Would you like to be notified about changes in its status in the incident channel?"
-                        ),
-                        Section(text=status_text),
-                        Actions(
-                            block_id=LinkMonitorBlockIds.monitor,
-                            elements=[
-                                Button(
-                                    text="Monitor",
-                                    action_id=LinkMonitorActionIds.monitor,
-                                    style="primary",
-                                    value=button_metadata,
-                                ),
-                                Button(
-                                    text="Ignore",
-                                    action_id=LinkMonitorActionIds.ignore,
-                                    style="primary",
-                                    value=button_metadata,
-                                ),
-                            ],
-                        ),
-                    ]
-                    blocks = Message(blocks=blocks).build()["blocks"]
-                    client.chat_postEphemeral(
-                        text="Link Monitor",
-                        channel=payload["channel"],
-                        thread_ts=payload.get("thread_ts"),
-                        blocks=blocks,
-                        user=payload["user"],
-                    )
+    if not candidates:
+        return
+
+    # one IN query for all matched links instead of a lookup per link
+    existing_weblinks = monitor_service.get_by_weblinks(
+        db_session=db_session, weblinks=[md["weblink"] for _, md in candidates]
+    )
+
+    # most metadata fields are invariant across matches; validate the model
+    # once and copy-update the per-match fields (copy skips re-validation)
+    base_metadata = MonitorMetadata(
+        type="incident",
+        organization_slug=organization_slug,
+        id=incident.id,
+        project_id=project_id,
+        channel_id=context["channel_id"],
+        plugin_instance_id=0,
+    )
+
+    def notify(candidate) -> None:
+        p, match_data = candidate
+
+        current_status = p.instance.get_match_status(match_data)
+        if not current_status:
+            return
+
+        # title-case the keys only; values may be issue titles or ids where
+        # case folding is wrong
+        status_text = "".join(f"*{k.title()}*:\n{v}\n" for k, v in current_status.items())
+
+        button_metadata = base_metadata.copy(
+            update={"plugin_instance_id": p.id, "weblink": match_data["weblink"]}
+        ).json()
+
+        blocks = [
+            Section(
+                text=f"Hi! Dispatch is able to monitor the status of the following resource: \n {match_data['weblink']} \n\n Would you like to be notified about changes in its status in the incident channel?"
+            ),
+            Section(text=status_text),
+            Actions(
+                block_id=LinkMonitorBlockIds.monitor,
+                elements=[
+                    Button(
+                        text="Monitor",
+                        action_id=LinkMonitorActionIds.monitor,
+                        style="primary",
+                        value=button_metadata,
+                    ),
+                    Button(
+                        text="Ignore",
+                        action_id=LinkMonitorActionIds.ignore,
+                        style="primary",
+                        value=button_metadata,
+                    ),
+                ],
+            ),
+        ]
+        # build each block directly; wrapping in Message() only to
+        # unwrap ["blocks"] revalidates the whole tree for nothing
+        blocks = [block.build() for block in blocks]
+        client.chat_postEphemeral(
+            text="Link Monitor",
+            channel=payload["channel"],
+            thread_ts=payload.get("thread_ts"),
+            blocks=blocks,
+            user=payload["user"],
+        )
+
+    # silence ignored matches
+    to_notify = [c for c in candidates if c[1]["weblink"] not in existing_weblinks]
+    if not to_notify:
+        return
+
+    if len(to_notify) == 1:
+        notify(to_notify[0])
+    else:
+        # the status fetch and ephemeral post for each link are independent
+        # network calls, so fan them out rather than paying N round-trips
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(notify, to_notify))
+
+
+@message_dispatcher.add(subject="incident")
+def handle_incident_message(
+    ack: Ack,
+    body: dict,
+    client: WebClient,
+    context: BoltContext,
+    db_session: Session,
+    payload: dict,
+    request: BoltRequest,
+    user: DispatchUser,
+) -> None:
+    """Runs all per-message incident behaviors off a single incident/participant load."""
+    ack()
+
+    subtype = body.get("event", {}).get("subtype", "")
+    incident = incident_service.get_for_slack_handlers(
+        db_session=db_session, incident_id=context["subject"].id
+    )
+    participant = participant_service.get_by_incident_id_and_email(
+        db_session=db_session, incident_id=context["subject"].id, email=user.email
+    )
+
+    # each behavior is isolated like the dispatcher isolates registered
+    # functions: one failing must not abort the others for the same message
+    def run(func, *args):
+        try:
+            func(*args)
+        except Exception as e:
+            log.exception(e)
+            log.debug(f"Failed to run message behavior {func.__name__}. Reason: ({e})")
+
+    # we ignore channel join and leave messages
+    if subtype not in ("channel_join", "channel_leave"):
+        run(handle_participant_role_activity, db_session, context, participant)
+
+    # we ignore user channel and group join messages
+    if subtype not in ("channel_join", "group_join"):
+        run(handle_after_hours_message, client, db_session, payload, incident, participant)
+
+    run(handle_thread_creation, client, payload, context, request)
+    run(handle_message_monitor, payload, context, client, db_session, incident)
 
 
 @app.event(
@@ -952,7 +1171,9 @@ def handle_member_joined_channel(
 
     participant.user_conversation_id = context["user_id"]
 
-    incident = incident_service.get(db_session=db_session, incident_id=context["subject"].id)
+    incident = incident_service.get_for_slack_handlers(
+        db_session=db_session, incident_id=context["subject"].id
+    )
 
     # If the user was invited, the message will include an inviter property containing the user ID of the inviting user.
     # The property will be absent when a user manually joins a channel, or a user is added by default (e.g. #general channel).
@@ -963,7 +1184,11 @@ def handle_member_joined_channel(
 
     if inviter and inviter_is_user:
         # Participant is added into the incident channel using an @ message or /invite command.
-        inviter_email = get_user_email(client=client, user_id=inviter)
+        if inviter == context["user_id"]:
+            # the joining member invited themselves; their email is already resolved
+            inviter_email = user.email
+        else:
+            inviter_email = get_user_email(client=client, user_id=inviter)
         added_by_participant = participant_service.get_by_incident_id_and_email(
             db_session=db_session, incident_id=context["subject"].id, email=inviter_email
         )
@@ -972,7 +1197,7 @@ def handle_member_joined_channel(
     else:
         # User joins via the `join` button on Web Application or Slack.
         # We default to the incident commander when we don't know who added the user or the user is the Dispatch bot.
-        incident = incident_service.get(db_session=db_session, incident_id=context["subject"].id)
+        # the incident loaded above already carries its commander and individual
         participant.added_by = incident.commander
 
     # Message text when someone @'s a user is not available in body, use generic added by reason
@@ -996,6 +1221,29 @@ def handle_member_left_channel(
 # MODALS
 
 
+@lru_cache(maxsize=128)
+def _add_timeline_event_modal(description: str | None, date: str, time: str) -> dict:
+    """Builds the add-timeline-event modal, memoized on its only dynamic inputs."""
+    blocks = [
+        Context(
+            elements=[
+                MarkdownText(text="Use this form to add an event to the incident's timeline.")
+            ]
+        ),
+        description_input(initial_value=description),
+    ]
+
+    blocks.extend(datetime_picker_block(initial_option=date + "|" + time))
+
+    return Modal(
+        title="Add Timeline Event",
+        blocks=blocks,
+        submit="Add",
+        close="Close",
+        callback_id=AddTimelineEventActions.submit,
+    ).build()
+
+
 def handle_add_timeline_event_command(
     ack: Ack, body: dict, client: WebClient, context: BoltContext
 ) -> None:
@@ -1027,35 +1275,26 @@ def handle_add_timeline_event_command(
             ).group(1)
         ).strip()
 
-    blocks = [
-        Context(
-            elements=[
-                MarkdownText(text="Use this form to add an event to the incident's timeline.")
-            ]
-        ),
-        description_input(initial_value=description),
-    ]
+    modal = {
+        **_add_timeline_event_modal(description, date, time),
+        "private_metadata": context["subject"].json(),
+    }
 
-    blocks.extend(datetime_picker_block(initial_option=date + "|" + time))
+    client.views_open(trigger_id=body["trigger_id"], view=modal)
 
-    modal = Modal(
-        title="Add Timeline Event",
-        blocks=blocks,
-        submit="Add",
-        close="Close",
-        callback_id=AddTimelineEventActions.submit,
-        private_metadata=context["subject"].json(),
-    ).build()
 
-    client.views_open(trigger_id=body["trigger_id"], view=modal)
+@lru_cache(maxsize=None)
+def _processing_view(title: str, text: str) -> dict:
+    """Builds the static processing modal used to ack a submission, once per title/text."""
+    return Modal(title=title, close="Close", blocks=[Section(text=text)]).build()
 
 
 def ack_add_timeline_submission_event(ack: Ack) -> None:
     """Handles the add timeline submission event acknowledgement."""
-    modal = Modal(
-        title="Add Timeline Event", close="Close", blocks=[Section(text="Adding timeline event...")]
-    ).build()
-    ack(response_action="update", view=modal)
+    ack(
+        response_action="update",
+        view=_processing_view("Add Timeline Event", "Adding timeline event..."),
+    )
 
 
 @app.view(
@@ -1091,7 +1330,7 @@ def handle_add_timeline_submission_event(
             event_timezone = participant_profile.get("tz")
 
     event_dt = datetime.fromisoformat(f"{event_date}T{event_hour}:{event_minute}")
-    event_dt_utc = pytz.timezone(event_timezone).localize(event_dt).astimezone(pytz.utc)
+    event_dt_utc = event_dt.replace(tzinfo=get_timezone(event_timezone)).astimezone(timezone.utc)
 
     event_service.log_incident_event(
         db_session=db_session,
@@ -1124,7 +1363,7 @@ def handle_update_participant_command(
     if context["subject"].type == "case":
         raise CommandError("Command is not currently available for cases.")
 
-    incident = incident_service.get(
+    incident = incident_service.get_with_participants(
         db_session=context["db_session"], incident_id=context["subject"].id
     )
 
@@ -1161,10 +1400,10 @@ def handle_update_participant_command(
 
 def ack_update_participant_submission_event(ack: Ack):
     """Handles the update participant submission event."""
-    modal = Modal(
-        title="Update Participant", close="Close", blocks=[Section(text="Updating participant...")]
-    ).build()
-    ack(response_action="update", view=modal)
+    ack(
+        response_action="update",
+        view=_processing_view("Update Participant", "Updating participant..."),
+    )
 
 
 @app.view(
@@ -1212,7 +1451,7 @@ def handle_update_notifications_group_command(
 
     incident = incident_service.get(db_session=db_session, incident_id=context["subject"].id)
 
-    group_plugin = plugin_service.get_active_instance(
+    group_plugin = plugin_service.get_active_instance_cached(
         db_session=db_session, project_id=incident.project.id, plugin_type="participant-group"
     )
     if not group_plugin:
@@ -1257,43 +1496,38 @@ def handle_update_notifications_group_command(
     client.views_open(trigger_id=body["trigger_id"], view=modal)
 
 
+def _parse_members(members: str) -> set:
+    """Parses a comma-separated member list into a set of non-empty addresses."""
+    return {member.strip() for member in members.split(",") if member.strip()}
+
+
 def ack_update_notifications_group_submission_event(ack: Ack):
     """Handles the update notifications group submission acknowledgement."""
-    modal = Modal(
-        title="Update Group Members",
-        close="Close",
-        blocks=[Section(text="Updating notifications group...")],
-    ).build()
-    ack(response_action="update", view=modal)
+    ack(
+        response_action="update",
+        view=_processing_view("Update Group Members", "Updating notifications group..."),
+    )
 
 
-@app.view(
-    UpdateNotificationGroupActions.submit,
-    middleware=[action_context_middleware, db_middleware, user_middleware, modal_submit_middleware],
-)
 def handle_update_notifications_group_submission_event(
     ack: Ack,
     body: dict,
     client: WebClient,
     context: BoltContext,
-    db_session: Session,
     form_data: dict,
 ) -> None:
     """Handles the update notifications group submission event."""
     ack_update_notifications_group_submission_event(ack=ack)
+    db_session = _lazy_session(context)
 
-    current_members = (
-        body["view"]["blocks"][1]["element"]["initial_value"].replace(" ", "").split(",")
-    )
-    updated_members = (
-        form_data.get(UpdateNotificationGroupBlockIds.members).replace(" ", "").split(",")
-    )
-    members_added = list(set(updated_members) - set(current_members))
-    members_removed = list(set(current_members) - set(updated_members))
+    current_members = _parse_members(body["view"]["blocks"][1]["element"]["initial_value"])
+    updated_members = _parse_members(form_data.get(UpdateNotificationGroupBlockIds.members))
+    members_added = list(updated_members - current_members)
+    members_removed = list(current_members - updated_members)
 
     incident = incident_service.get(db_session=db_session, incident_id=context["subject"].id)
 
-    group_plugin = plugin_service.get_active_instance(
+    group_plugin = plugin_service.get_active_instance_cached(
         db_session=db_session, project_id=incident.project.id, plugin_type="participant-group"
     )
 
@@ -1308,18 +1542,27 @@ def handle_update_notifications_group_submission_event(
     )
 
 
-def handle_assign_role_command(
-    ack: Ack, body: dict, context: BoltContext, client: WebClient
-) -> None:
-    """Handles the assign role command."""
-    ack()
+# registered lazily so the group plugin add/remove calls don't hold the HTTP worker
+app.view(
+    UpdateNotificationGroupActions.submit,
+    middleware=[action_context_middleware, db_middleware, user_middleware, modal_submit_middleware],
+)(
+    ack=ack_update_notifications_group_submission_event,
+    lazy=[handle_update_notifications_group_submission_event],
+)
 
-    roles = [
-        {"text": r.value, "value": r.value}
-        for r in ParticipantRoleType
-        if r != ParticipantRoleType.participant
-    ]
 
+# assignable roles are a compile-time constant of the role enum
+_ASSIGNABLE_ROLES = tuple(
+    {"text": r.value, "value": r.value}
+    for r in ParticipantRoleType
+    if r != ParticipantRoleType.participant
+)
+
+
+@lru_cache(maxsize=1)
+def _assign_role_modal() -> dict:
+    """Builds the assign-role modal once; only private_metadata varies per invocation."""
     blocks = [
         Context(
             elements=[
@@ -1334,27 +1577,35 @@ def handle_assign_role_command(
             element=UsersSelect(placeholder="Participant"),
         ),
         static_select_block(
-            placeholder="Select Role", label="Role", options=roles, block_id=AssignRoleBlockIds.role
+            placeholder="Select Role",
+            label="Role",
+            options=list(_ASSIGNABLE_ROLES),
+            block_id=AssignRoleBlockIds.role,
         ),
     ]
 
-    modal = Modal(
+    return Modal(
         title="Assign Role",
         submit="Assign",
         close="Cancel",
         blocks=blocks,
         callback_id=AssignRoleActions.submit,
-        private_metadata=context["subject"].json(),
     ).build()
+
+
+def handle_assign_role_command(
+    ack: Ack, body: dict, context: BoltContext, client: WebClient
+) -> None:
+    """Handles the assign role command."""
+    ack()
+
+    modal = {**_assign_role_modal(), "private_metadata": context["subject"].json()}
     client.views_open(trigger_id=body["trigger_id"], view=modal)
 
 
 def ack_assign_role_submission_event(ack: Ack):
     """Handles the assign role submission acknowledgement."""
-    modal = Modal(
-        title="Assign Role", close="Close", blocks=[Section(text="Assigning role...")]
-    ).build()
-    ack(response_action="update", view=modal)
+    ack(response_action="update", view=_processing_view("Assign Role", "Assigning role..."))
 
 
 @app.view(
@@ -1420,9 +1671,9 @@ def handle_engage_oncall_command(
 
     oncall_services = service_service.get_all_by_project_id_and_status(
         db_session=db_session, project_id=incident.project.id, is_active=True
-    )
+    ).all()
 
-    if not oncall_services.count():
+    if not oncall_services:
         raise CommandError(
             "No oncall services have been defined. You can define them in the Dispatch UI at /services."
         )
@@ -1461,10 +1712,7 @@ def handle_engage_oncall_command(
 
 def ack_engage_oncall_submission_event(ack: Ack) -> None:
     """Handles engage oncall acknowledgment."""
-    modal = Modal(
-        title="Engage Oncall", close="Close", blocks=[Section(text="Engaging oncall...")]
-    ).build()
-    ack(response_action="update", view=modal)
+    ack(response_action="update", view=_processing_view("Engage Oncall", "Engaging oncall..."))
 
 
 @app.view(
@@ -1606,10 +1854,10 @@ def handle_report_tactical_command(
 
 def ack_report_tactical_submission_event(ack: Ack) -> None:
     """Handles report tactical acknowledgment."""
-    modal = Modal(
-        title="Report Tactical", close="Close", blocks=[Section(text="Creating tactical report...")]
-    ).build()
-    ack(response_action="update", view=modal)
+    ack(
+        response_action="update",
+        view=_processing_view("Report Tactical", "Creating tactical report..."),
+    )
 
 
 @app.view(
@@ -1715,12 +1963,10 @@ def handle_report_executive_command(
 
 def ack_report_executive_submission_event(ack: Ack) -> None:
     """Handles executive submission acknowledgement."""
-    modal = Modal(
-        title="Executive Report",
-        close="Close",
-        blocks=[Section(text="Creating executive report...")],
-    ).build()
-    ack(response_action="update", view=modal)
+    ack(
+        response_action="update",
+        view=_processing_view("Executive Report", "Creating executive report..."),
+    )
 
 
 @app.view(
@@ -1865,36 +2111,26 @@ def handle_update_incident_command(
 
 def ack_incident_update_submission_event(ack: Ack) -> None:
     """Handles incident update submission event."""
-    modal = Modal(
-        title="Incident Update",
-        close="Close",
-        blocks=[Section(text="Updating incident...")],
-    ).build()
-    ack(response_action="update", view=modal)
+    ack(response_action="update", view=_processing_view("Incident Update", "Updating incident..."))
 
 
-@app.view(
-    IncidentUpdateActions.submit,
-    middleware=[action_context_middleware, db_middleware, user_middleware, modal_submit_middleware],
-)
 def handle_update_incident_submission_event(
     ack: Ack,
     body: dict,
     client: WebClient,
     context: BoltContext,
-    db_session: Session,
     form_data: dict,
-    user: DispatchUser,
 ) -> None:
     """Handles the update incident submission"""
     ack_incident_update_submission_event(ack=ack)
-    incident = incident_service.get(db_session=db_session, incident_id=context["subject"].id)
+    db_session = _lazy_session(context)
+    incident = incident_service.get_for_update(
+        db_session=db_session, incident_id=context["subject"].id
+    )
 
-    tags = []
-    for t in form_data.get(DefaultBlockIds.tags_multi_select, []):
-        # we have to fetch as only the IDs are embedded in slack
-        tag = tag_service.get(db_session=db_session, tag_id=int(t["value"]))
-        tags.append(tag)
+    # only the ids are embedded in Slack; resolve them all with one query
+    tag_ids = [int(t["value"]) for t in form_data.get(DefaultBlockIds.tags_multi_select, [])]
+    tags = tag_service.get_by_ids(db_session=db_session, tag_ids=tag_ids)
 
     cost_model = None
     if form_data.get(DefaultBlockIds.cost_model_select):
@@ -1902,19 +2138,29 @@ def handle_update_incident_submission_event(
             db_session=db_session,
             cost_model_id=int(form_data[DefaultBlockIds.cost_model_select]["value"]),
         )
+    # the name-only nested models come from our own modal payload; construct()
+    # skips re-validating them while the outer model keeps full validation
     incident_in = IncidentUpdate(
         title=form_data[DefaultBlockIds.title_input],
         description=form_data[DefaultBlockIds.description_input],
         resolution=form_data[DefaultBlockIds.resolution_input],
-        incident_type={"name": form_data[DefaultBlockIds.incident_type_select]["name"]},
-        incident_severity={"name": form_data[DefaultBlockIds.incident_severity_select]["name"]},
-        incident_priority={"name": form_data[DefaultBlockIds.incident_priority_select]["name"]},
+        incident_type=IncidentTypeBase.construct(
+            name=form_data[DefaultBlockIds.incident_type_select]["name"]
+        ),
+        incident_severity=IncidentSeverityBase.construct(
+            name=form_data[DefaultBlockIds.incident_severity_select]["name"]
+        ),
+        incident_priority=IncidentPriorityBase.construct(
+            name=form_data[DefaultBlockIds.incident_priority_select]["name"]
+        ),
         status=form_data[DefaultBlockIds.incident_status_select]["name"],
         tags=tags,
         cost_model=cost_model,
     )
 
-    previous_incident = IncidentRead.from_orm(incident)
+    # a narrow snapshot of just the diffed fields; from_orm would serialize
+    # the whole incident graph and trigger every lazy relationship
+    previous_incident = IncidentUpdateSnapshot.from_incident(incident)
 
     # we currently don't allow users to update the incident's visibility,
     # costs, terms, or duplicates via Slack, so we copy them over
@@ -1931,7 +2177,7 @@ def handle_update_incident_submission_event(
     reporter_email = updated_incident.reporter.individual.email
 
     incident_flows.incident_update_flow(
-        user.email,
+        context["user_email"],
         commander_email,
         reporter_email,
         context["subject"].id,
@@ -1939,14 +2185,25 @@ def handle_update_incident_submission_event(
         db_session=db_session,
     )
 
-    send_success_modal(
-        client=client,
-        view_id=body["view"]["id"],
-        title="Update Incident",
-        message="Incident updated successfully.",
+    # the user has usually closed the processing modal by now; confirm with an
+    # ephemeral message instead of spending another views_update round-trip
+    client.chat_postEphemeral(
+        text=f"Incident {updated_incident.name} updated successfully.",
+        channel=updated_incident.conversation.channel_id,
+        user=body["user"]["id"],
     )
 
 
+# registered lazily so the update flow's DB and Slack work doesn't hold the HTTP worker
+app.view(
+    IncidentUpdateActions.submit,
+    middleware=[action_context_middleware, db_middleware, user_middleware, modal_submit_middleware],
+)(
+    ack=ack_incident_update_submission_event,
+    lazy=[handle_update_incident_submission_event],
+)
+
+
 @app.shortcut(
     IncidentShortcutCallbacks.report, middleware=[db_middleware, shortcut_context_middleware]
 )
@@ -2038,47 +2295,47 @@ def handle_report_incident_command(
 
 def ack_report_incident_submission_event(ack: Ack) -> None:
     """Handles the report incident submission event acknowledgment."""
-    modal = Modal(
-        title="Report Incident",
-        close="Close",
-        blocks=[Section(text="Creating incident resources...")],
-    ).build()
-    ack(response_action="update", view=modal)
+    ack(
+        response_action="update",
+        view=_processing_view("Report Incident", "Creating incident resources..."),
+    )
 
 
-@app.view(
-    IncidentReportActions.submit,
-    middleware=[action_context_middleware, db_middleware, user_middleware, modal_submit_middleware],
-)
 def handle_report_incident_submission_event(
     ack: Ack,
     body: dict,
     client: WebClient,
-    db_session: Session,
+    context: BoltContext,
     form_data: dict,
-    user: DispatchUser,
 ) -> None:
     """Handles the report incident submission"""
     ack_report_incident_submission_event(ack=ack)
-    tags = []
-    for t in form_data.get(DefaultBlockIds.tags_multi_select, []):
-        # we have to fetch as only the IDs are embedded in Slack
-        tag = tag_service.get(db_session=db_session, tag_id=int(t["value"]))
-        tags.append(tag)
+    db_session = _lazy_session(context)
+    # only the ids are embedded in Slack; resolve them all with one query
+    tag_ids = [int(t["value"]) for t in form_data.get(DefaultBlockIds.tags_multi_select, [])]
+    tags = tag_service.get_by_ids(db_session=db_session, tag_ids=tag_ids)
 
-    project = {"name": form_data[DefaultBlockIds.project_select]["name"]}
+    # name-only nested models from our own modal payload; construct() skips
+    # re-validating them while the outer model keeps full validation
+    project = ProjectRead.construct(name=form_data[DefaultBlockIds.project_select]["name"])
 
     incident_type = None
     if form_data.get(DefaultBlockIds.incident_type_select):
-        incident_type = {"name": form_data[DefaultBlockIds.incident_type_select]["name"]}
+        incident_type = IncidentTypeCreate.construct(
+            name=form_data[DefaultBlockIds.incident_type_select]["name"]
+        )
 
     incident_priority = None
     if form_data.get(DefaultBlockIds.incident_priority_select):
-        incident_priority = {"name": form_data[DefaultBlockIds.incident_priority_select]["name"]}
+        incident_priority = IncidentPriorityCreate.construct(
+            name=form_data[DefaultBlockIds.incident_priority_select]["name"]
+        )
 
     incident_severity = None
     if form_data.get(DefaultBlockIds.incident_severity_select):
-        incident_severity = {"name": form_data[DefaultBlockIds.incident_severity_select]["name"]}
+        incident_severity = IncidentSeverityCreate.construct(
+            name=form_data[DefaultBlockIds.incident_severity_select]["name"]
+        )
 
     cost_model = None
     if form_data.get(DefaultBlockIds.cost_model_select):
@@ -2094,50 +2351,41 @@ def handle_report_incident_submission_event(
         incident_priority=incident_priority,
         incident_severity=incident_severity,
         project=project,
-        reporter=ParticipantUpdate(individual=IndividualContactRead(email=user.email)),
+        reporter=ParticipantUpdate.construct(
+            individual=IndividualContactRead.construct(email=context["user_email"])
+        ),
         tags=tags,
         cost_model=cost_model,
     )
 
-    blocks = [
-        Section(text="Creating your incident..."),
-    ]
-
-    modal = Modal(title="Incident Report", blocks=blocks, close="Close").build()
-
-    result = client.views_update(
-        view_id=body["view"]["id"],
-        trigger_id=body["trigger_id"],
-        view=modal,
-    )
-
-    # Create the incident
+    # Create the incident; the ack already swapped the modal to a processing view
     incident = incident_service.create(db_session=db_session, incident_in=incident_in)
 
-    blocks = [
-        Section(
-            text="This is a confirmation that you have reported an incident with the following information. You will be invited to an incident Slack conversation shortly."
-        ),
-        Section(text=f"*Title*\n {incident.title}"),
-        Section(text=f"*Description*\n {incident.description}"),
-        Section(
-            fields=[
-                MarkdownText(
-                    text=f"*Commander*\n<{incident.commander.individual.weblink}|{incident.commander.individual.name}>"
-                ),
-                MarkdownText(text=f"*Type*\n {incident.incident_type.name}"),
-                MarkdownText(text=f"*Severity*\n {incident.incident_severity.name}"),
-                MarkdownText(text=f"*Priority*\n {incident.incident_priority.name}"),
-            ]
-        ),
-    ]
-    modal = Modal(title="Incident Report", blocks=blocks, close="Close").build()
+    if context["config"].show_report_confirmation_modal:
+        blocks = [
+            Section(
+                text="This is a confirmation that you have reported an incident with the following information. You will be invited to an incident Slack conversation shortly."
+            ),
+            Section(text=f"*Title*\n {incident.title}"),
+            Section(text=f"*Description*\n {incident.description}"),
+            Section(
+                fields=[
+                    MarkdownText(
+                        text=f"*Commander*\n<{incident.commander.individual.weblink}|{incident.commander.individual.name}>"
+                    ),
+                    MarkdownText(text=f"*Type*\n {incident.incident_type.name}"),
+                    MarkdownText(text=f"*Severity*\n {incident.incident_severity.name}"),
+                    MarkdownText(text=f"*Priority*\n {incident.incident_priority.name}"),
+                ]
+            ),
+        ]
+        modal = Modal(title="Incident Report", blocks=blocks, close="Close").build()
 
-    result = client.views_update(
-        view_id=result["view"]["id"],
-        trigger_id=result["trigger_id"],
-        view=modal,
-    )
+        client.views_update(
+            view_id=body["view"]["id"],
+            trigger_id=body["trigger_id"],
+            view=modal,
+        )
 
     incident_flows.incident_create_flow(
         incident_id=incident.id,
@@ -2146,6 +2394,22 @@ def handle_report_incident_submission_event(
     )
 
 
+# registered lazily so incident creation doesn't hold the HTTP worker
+app.view(
+    IncidentReportActions.submit,
+    middleware=[
+        action_context_middleware,
+        db_middleware,
+        user_middleware,
+        modal_submit_middleware,
+        configuration_middleware,
+    ],
+)(
+    ack=ack_report_incident_submission_event,
+    lazy=[handle_report_incident_submission_event],
+)
+
+
 @app.action(
     IncidentReportActions.project_select, middleware=[action_context_middleware, db_middleware]
 )
@@ -2196,47 +2460,90 @@ def handle_report_incident_project_select_action(
         private_metadata=context["subject"].json(),
     ).build()
 
+    # no hash guard: when the user flips projects quickly the latest render
+    # should win rather than erroring with hash_conflict
     client.views_update(
         view_id=body["view"]["id"],
-        hash=body["view"]["hash"],
         trigger_id=body["trigger_id"],
         view=modal,
     )
 
 
 # BUTTONS
-@app.action(
-    IncidentNotificationActions.invite_user, middleware=[button_context_middleware, db_middleware]
+_MSG_INCIDENT_NOT_FOUND = (
+    "Sorry, we can't invite you to this incident. The incident does not exist."
 )
+_MSG_INCIDENT_RESTRICTED = "Sorry, we can't invite you to this incident. The incident's visbility is restricted. Please, reach out to the incident commander if you have any questions."
+_MSG_INCIDENT_CLOSED_JOIN = "Sorry, you can't join this incident. The incident has already been marked as closed. Please, reach out to the incident commander if you have any questions."
+_MSG_INCIDENT_CLOSED_SUBSCRIBE = "Sorry, you can't subscribe to this incident. The incident has already been marked as closed. Please, reach out to the incident commander if you have any questions."
+_MSG_ALREADY_MEMBER = "Sorry, we can't invite you to this incident - you're already a member. Search for a channel called {name} in your Slack sidebar."
+_MSG_JOIN_SUCCESS = "Success! We've added you to incident {name}. Please, check your Slack sidebar for the new incident channel."
+_MSG_SUBSCRIBE_SUCCESS = "Success! We've subscribed you to incident {name}. You will start receiving all tactical reports about this incident via email."
+
+
+def _preflight_notification_action(
+    db_session: Session, context: BoltContext, closed_message: str
+) -> tuple[IncidentSnapshot | None, str | None]:
+    """Runs the existence/visibility/status gate shared by the notification buttons.
+
+    Returns the incident snapshot and None when the action may proceed, or
+    None and the message to show the user when it may not.
+    """
+    snapshot = get_incident_snapshot(db_session, context["subject"].id)
+    if not snapshot:
+        return None, _MSG_INCIDENT_NOT_FOUND
+    if snapshot.visibility == Visibility.restricted:
+        return None, _MSG_INCIDENT_RESTRICTED
+    if snapshot.status == IncidentStatus.closed:
+        return None, closed_message
+    return snapshot, None
+
+
+def ack_incident_notification_join_button_click(ack: Ack):
+    """Acks the incident join button click so the invite runs off the request path."""
+    ack()
+
+
 def handle_incident_notification_join_button_click(
     ack: Ack,
     client: WebClient,
     respond: Respond,
-    db_session: Session,
     context: BoltContext,
 ):
     """Handles the incident join button click event."""
     ack()
-    incident = incident_service.get(db_session=db_session, incident_id=context["subject"].id)
+    db_session = _lazy_session(context)
+    incident, message = _preflight_notification_action(
+        db_session, context, _MSG_INCIDENT_CLOSED_JOIN
+    )
 
-    if not incident:
-        message = "Sorry, we can't invite you to this incident. The incident does not exist."
-    elif incident.visibility == Visibility.restricted:
-        message = "Sorry, we can't invite you to this incident. The incident's visbility is restricted. Please, reach out to the incident commander if you have any questions."
-    elif incident.status == IncidentStatus.closed:
-        message = "Sorry, you can't join this incident. The incident has already been marked as closed. Please, reach out to the incident commander if you have any questions."
-    else:
+    if not message:
         user_id = context["user_id"]
-        try:
-            client.conversations_invite(channel=incident.conversation.channel_id, users=[user_id])
-            message = f"Success! We've added you to incident {incident.name}. Please, check your Slack sidebar for the new incident channel."
-        except SlackApiError as e:
-            if e.response.get("error") == SlackAPIErrorCode.ALREADY_IN_CHANNEL:
-                message = f"Sorry, we can't invite you to this incident - you're already a member. Search for a channel called {incident.name.lower()} in your Slack sidebar."
+        if is_channel_member(client, incident.channel_id, user_id):
+            message = _MSG_ALREADY_MEMBER.format(name=incident.name.lower())
+        else:
+            try:
+                client.conversations_invite(channel=incident.channel_id, users=[user_id])
+                message = _MSG_JOIN_SUCCESS.format(name=incident.name)
+                with _channel_members_lock:
+                    members = _channel_members_cache.get(incident.channel_id)
+                if members is not None:
+                    members.add(user_id)
+            except SlackApiError as e:
+                if e.response.get("error") == SlackAPIErrorCode.ALREADY_IN_CHANNEL:
+                    message = _MSG_ALREADY_MEMBER.format(name=incident.name.lower())
 
     respond(text=message, response_type="ephemeral", replace_original=False, delete_original=False)
 
 
+app.action(
+    IncidentNotificationActions.invite_user, middleware=[button_context_middleware, db_middleware]
+)(
+    ack=ack_incident_notification_join_button_click,
+    lazy=[handle_incident_notification_join_button_click],
+)
+
+
 @app.action(
     IncidentNotificationActions.subscribe_user,
     middleware=[button_context_middleware, db_middleware],
@@ -2250,18 +2557,17 @@ def handle_incident_notification_subscribe_button_click(
 ):
     """Handles the incident subscribe button click event."""
     ack()
-    incident = incident_service.get(db_session=db_session, incident_id=context["subject"].id)
+    snapshot, message = _preflight_notification_action(
+        db_session, context, _MSG_INCIDENT_CLOSED_SUBSCRIBE
+    )
 
-    if not incident:
-        message = "Sorry, we can't invite you to this incident. The incident does not exist."
-    elif incident.visibility == Visibility.restricted:
-        message = "Sorry, we can't invite you to this incident. The incident's visbility is restricted. Please, reach out to the incident commander if you have any questions."
-    elif incident.status == IncidentStatus.closed:
-        message = "Sorry, you can't subscribe to this incident. The incident has already been marked as closed. Please, reach out to the incident commander if you have any questions."
-    else:
+    if not message:
         user_id = context["user_id"]
         user_email = get_user_email(client=client, user_id=user_id)
 
+        # the group flow needs the full incident; only load it once gated
+        incident = incident_service.get(db_session=db_session, incident_id=context["subject"].id)
+
         if incident.tactical_group:
             group_flows.update_group(
                 subject=incident,
@@ -2270,7 +2576,7 @@ def handle_incident_notification_subscribe_button_click(
                 group_member=user_email,
                 db_session=db_session,
             )
-        message = f"Success! We've subscribed you to incident {incident.name}. You will start receiving all tactical reports about this incident via email."
+        message = _MSG_SUBSCRIBE_SUCCESS.format(name=incident.name)
 
     respond(text=message, response_type="ephemeral", replace_original=False, delete_original=False)
 
@@ -293,6 +293,9 @@ def user_middleware(
         raise ContextError("Unable to determine user from context.")
 
     context["user"] = user
+    # the ORM user does not survive the deep copy Bolt makes for lazy
+    # listeners; keep a copy-safe email for handlers that run lazily
+    context["user_email"] = user.email
     return next()
 
 
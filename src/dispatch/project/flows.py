@@ -1,3 +1,5 @@
+from dataclasses import asdict
+
 from dispatch.case.priority import service as case_priority_service
 from dispatch.case.priority.config import default_case_priorities
 from dispatch.case.priority.models import CasePriorityCreate
@@ -8,9 +10,8 @@ from dispatch.case.type import service as case_type_service
 from dispatch.case.type.config import default_case_type
 from dispatch.case.type.models import CaseTypeCreate
 from dispatch.decorators import background_task
-from dispatch.incident.priority import service as incident_priority_service
 from dispatch.incident.priority.config import default_incident_priorities
-from dispatch.incident.priority.models import IncidentPriorityCreate
+from dispatch.incident.priority.models import IncidentPriority
 from dispatch.incident.severity import service as incident_severity_service
 from dispatch.incident.severity.config import default_incident_severities
 from dispatch.incident.severity.models import IncidentSeverityCreate
@@ -53,23 +54,15 @@ def project_init_flow(*, project_id: int, organization_slug: str, db_session=Non
         db_session=db_session, incident_type_in=incident_type_in
     )
 
-    # Create default incident priorities
-    for priority in default_incident_priorities:
-        incident_priority_in = IncidentPriorityCreate(
-            name=priority["name"],
-            description=priority["description"],
-            page_commander=priority["page_commander"],
-            tactical_report_reminder=priority["tactical_report_reminder"],
-            executive_report_reminder=priority["executive_report_reminder"],
-            project=project,
-            default=priority["default"],
-            enabled=priority["enabled"],
-            view_order=priority["view_order"],
-            color=priority["color"],
-        )
-        incident_priority_service.create(
-            db_session=db_session, incident_priority_in=incident_priority_in
-        )
+    # Create default incident priorities in one bulk insert
+    db_session.execute(
+        IncidentPriority.__table__.insert(),
+        [
+            {**asdict(priority), "project_id": project.id}
+            for priority in default_incident_priorities()
+        ],
+    )
+    db_session.commit()
 
     # Create default incident severities
     for severity in default_incident_severities:
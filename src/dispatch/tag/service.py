@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 
 from dispatch.exceptions import NotFoundError
@@ -13,6 +13,13 @@ def get(*, db_session, tag_id: int) -> Optional[Tag]:
     return db_session.query(Tag).filter(Tag.id == tag_id).one_or_none()
 
 
+def get_by_ids(*, db_session, tag_ids: List[int]) -> List[Tag]:
+    """Gets all tags matching the given ids with a single query."""
+    if not tag_ids:
+        return []
+    return db_session.query(Tag).filter(Tag.id.in_(tag_ids)).all()
+
+
 def get_by_name(*, db_session, project_id: int, name: str) -> Optional[Tag]:
     """Gets a tag by its project and name."""
     return (
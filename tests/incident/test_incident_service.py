@@ -0,0 +1,76 @@
+def test_get_for_slack_handlers(session, incident):
+    from dispatch.incident.service import get_for_slack_handlers
+
+    t_incident = get_for_slack_handlers(db_session=session, incident_id=incident.id)
+    assert t_incident.id == incident.id
+    assert t_incident.project.organization
+
+
+def test_get_with_participants(session, incident, participant):
+    from dispatch.incident.service import get_with_participants
+
+    participant.incident_id = incident.id
+    session.add(participant)
+    session.commit()
+
+    t_incident = get_with_participants(db_session=session, incident_id=incident.id)
+    assert t_incident.id == incident.id
+    assert participant.id in [p.id for p in t_incident.participants]
+
+
+def test_get_for_update(session, incident):
+    from dispatch.incident.service import get_for_update
+
+    t_incident = get_for_update(db_session=session, incident_id=incident.id)
+    assert t_incident.id == incident.id
+    assert t_incident.incident_type
+    assert t_incident.incident_severity
+    assert t_incident.incident_priority
+
+
+def test_get_notification_summary(session, incident):
+    from dispatch.incident.service import get_notification_summary
+
+    summary = get_notification_summary(db_session=session, incident_id=incident.id)
+    assert summary.name == incident.name
+    assert summary.status == incident.status
+    assert summary.visibility == incident.visibility
+    assert summary.channel_id == incident.conversation.channel_id
+
+
+def test_get_notification_summary__not_found(session):
+    from dispatch.incident.service import get_notification_summary
+
+    assert get_notification_summary(db_session=session, incident_id=0) is None
+
+
+def test_get_all_open_or_recently_closed(session, incident):
+    from dispatch.enums import Visibility
+    from dispatch.incident.enums import IncidentStatus
+    from dispatch.incident.service import get_all_open_or_recently_closed
+
+    incident.status = IncidentStatus.active
+    incident.visibility = Visibility.open
+    session.add(incident)
+    session.commit()
+
+    incidents = get_all_open_or_recently_closed(
+        db_session=session, project_ids=[incident.project_id]
+    )
+    assert incident.id in [i.id for i in incidents]
+
+
+def test_get_all_open_or_recently_closed__excludes_restricted(session, incident):
+    from dispatch.enums import Visibility
+    from dispatch.incident.enums import IncidentStatus
+    from dispatch.incident.service import get_all_open_or_recently_closed
+
+    incident.status = IncidentStatus.active
+    incident.visibility = Visibility.restricted
+    session.add(incident)
+    session.commit()
+
+    incidents = get_all_open_or_recently_closed(
+        db_session=session, project_ids=[incident.project_id]
+    )
+    assert incident.id not in [i.id for i in incidents]
@@ -59,3 +59,12 @@ def test_delete(session, incident_priority):
 
     delete(db_session=session, incident_priority_id=incident_priority.id)
     assert not get(db_session=session, incident_priority_id=incident_priority.id)
+
+
+def test_default_incident_priorities():
+    from dispatch.incident.priority.config import default_incident_priorities
+
+    priorities = default_incident_priorities()
+    assert [priority.name for priority in priorities] == ["Low", "Medium", "High"]
+    # built once and reused; new-project setup reads these on every call
+    assert priorities is default_incident_priorities()
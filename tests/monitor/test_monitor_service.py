@@ -0,0 +1,17 @@
+def test_get_by_weblinks(session, incident):
+    from dispatch.monitor.models import Monitor
+    from dispatch.monitor.service import get_by_weblinks
+
+    weblink = "https://www.example.com/workflow/1"
+    monitor = Monitor(weblink=weblink, incident_id=incident.id)
+    session.add(monitor)
+    session.commit()
+
+    existing = get_by_weblinks(db_session=session, weblinks=[weblink, "https://www.example.com/workflow/2"])
+    assert existing == {weblink}
+
+
+def test_get_by_weblinks__empty(session):
+    from dispatch.monitor.service import get_by_weblinks
+
+    assert get_by_weblinks(db_session=session, weblinks=[]) == set()
@@ -36,3 +36,21 @@ def test_delete(session, participant_role):
 
     delete(db_session=session, participant_role_id=participant_role.id)
     assert not get(db_session=session, participant_role_id=participant_role.id)
+
+
+def test_get_all_active_roles_by_incident_id(session, incident, participant):
+    from datetime import datetime
+
+    from dispatch.participant_role.models import ParticipantRole
+    from dispatch.participant_role.service import get_all_active_roles_by_incident_id
+
+    participant.incident_id = incident.id
+    active_role = ParticipantRole(participant_id=participant.id)
+    renounced_role = ParticipantRole(participant_id=participant.id, renounced_at=datetime.utcnow())
+    session.add_all([participant, active_role, renounced_role])
+    session.commit()
+
+    roles_by_participant_id = get_all_active_roles_by_incident_id(
+        db_session=session, incident_id=incident.id
+    )
+    assert [role.id for role in roles_by_participant_id[participant.id]] == [active_role.id]
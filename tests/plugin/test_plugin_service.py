@@ -50,6 +50,66 @@ def test_update_instance(session, plugin_instance):
     assert plugin_instance.enabled == enabled
 
 
+def test_get_active_instance_cached(session, plugin_instance):
+    from dispatch.database.core import get_schema_for_session
+    from dispatch.plugin.service import _active_instance_id_cache, get_active_instance_cached
+
+    _active_instance_id_cache.clear()
+
+    t_plugin_instance = get_active_instance_cached(
+        db_session=session,
+        plugin_type=plugin_instance.plugin.type,
+        project_id=plugin_instance.project_id,
+    )
+    assert t_plugin_instance.id == plugin_instance.id
+
+    # the cache key carries the tenant schema so ids don't collide across organizations
+    key = (
+        get_schema_for_session(session),
+        plugin_instance.project_id,
+        plugin_instance.plugin.type,
+    )
+    assert _active_instance_id_cache[key] == plugin_instance.id
+
+    # cached lookups resolve the id through the caller's session
+    t_plugin_instance = get_active_instance_cached(
+        db_session=session,
+        plugin_type=plugin_instance.plugin.type,
+        project_id=plugin_instance.project_id,
+    )
+    assert t_plugin_instance.id == plugin_instance.id
+
+
+def test_get_active_instance_cached__invalidated_on_update(session, plugin_instance):
+    from dispatch.plugin.models import PluginInstanceUpdate
+    from dispatch.plugin.service import (
+        _active_instance_id_cache,
+        get_active_instance_cached,
+        update_instance,
+    )
+
+    _active_instance_id_cache.clear()
+    get_active_instance_cached(
+        db_session=session,
+        plugin_type=plugin_instance.plugin.type,
+        project_id=plugin_instance.project_id,
+    )
+    assert len(_active_instance_id_cache)
+
+    update_instance(
+        db_session=session,
+        plugin_instance=plugin_instance,
+        plugin_instance_in=PluginInstanceUpdate(enabled=False),
+    )
+    assert not len(_active_instance_id_cache)
+
+    assert not get_active_instance_cached(
+        db_session=session,
+        plugin_type=plugin_instance.plugin.type,
+        project_id=plugin_instance.project_id,
+    )
+
+
 def test_delete_instance(session, plugin_instance):
     from dispatch.plugin.service import delete_instance, get_instance
 
@@ -50,3 +50,16 @@ def test_delete(session, tag):
 
     delete(db_session=session, tag_id=tag.id)
     assert not get(db_session=session, tag_id=tag.id)
+
+
+def test_get_by_ids(session, tag):
+    from dispatch.tag.service import get_by_ids
+
+    t_tags = get_by_ids(db_session=session, tag_ids=[tag.id])
+    assert [t_tag.id for t_tag in t_tags] == [tag.id]
+
+
+def test_get_by_ids__empty(session, tag):
+    from dispatch.tag.service import get_by_ids
+
+    assert get_by_ids(db_session=session, tag_ids=[]) == []